@@ -220,7 +220,7 @@ def example_save_and_load():
     loaded = load_series(config_path)
     series = loaded.build()
     print(f"Loaded: {series.name}")
-    print(f"Characters: {list(loaded._characters.keys())}")
+    print(f"Characters: {list(loaded.config.characters.keys())}")
 
 
 def example_style_presets():
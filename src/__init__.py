@@ -86,6 +86,7 @@ from .series.style import (
 # Series Models - Data structures
 from .series.series import (
     Series,
+    SeriesConfig,
     Episode,
     Scene,
     SeriesStatus,
@@ -143,6 +144,7 @@ __all__ = [
 
     # New API - Series Models
     "Series",
+    "SeriesConfig",
     "Episode",
     "Scene",
     "SeriesStatus",
@@ -19,6 +19,15 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Image file extension -> MIME type
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
 
 class GenerationStatus(Enum):
     """Status of a video generation job."""
@@ -294,15 +303,7 @@ class BaseVideoProvider(ABC):
     @staticmethod
     def get_mime_type(image_path: Union[str, Path]) -> str:
         """Get MIME type from file extension."""
-        ext = Path(image_path).suffix.lower()
-        mime_types = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".webp": "image/webp",
-            ".gif": "image/gif",
-        }
-        return mime_types.get(ext, "image/jpeg")
+        return _MIME_TYPES.get(Path(image_path).suffix.lower(), "image/jpeg")
 
     def prepare_reference_images(
         self,
@@ -15,11 +15,16 @@ logger = logging.getLogger(__name__)
 # Registry of available providers
 _PROVIDERS: Dict[str, Type[BaseVideoProvider]] = {}
 
+# Cached list_providers() result; reset whenever a provider registers
+_PROVIDER_NAMES: Optional[List[str]] = None
+
 
 def register_provider(name: str):
     """Decorator to register a provider class."""
     def decorator(cls: Type[BaseVideoProvider]):
+        global _PROVIDER_NAMES
         _PROVIDERS[name.lower()] = cls
+        _PROVIDER_NAMES = None
         return cls
     return decorator
 
@@ -85,13 +90,18 @@ def list_providers() -> List[str]:
     Returns:
         List of provider names
     """
-    # Ensure all providers are imported
-    try:
-        from . import fal, google, runway, piapi, minimax, luma, replicate
-    except ImportError:
-        pass
+    global _PROVIDER_NAMES
+    if _PROVIDER_NAMES is None:
+        # Ensure all providers are imported
+        try:
+            from . import fal, google, runway, piapi, minimax, luma, replicate
+        except ImportError:
+            pass
+
+        _PROVIDER_NAMES = list(_PROVIDERS.keys())
 
-    return list(_PROVIDERS.keys())
+    # Copy so callers can't mutate the cached list
+    return list(_PROVIDER_NAMES)
 
 
 def get_best_provider(
@@ -27,6 +27,7 @@ from .base import (
     GenerationStatus,
 )
 from .factory import register_provider
+from ..utils.image_utils import decode_base64
 
 logger = logging.getLogger(__name__)
 
@@ -299,8 +300,7 @@ class GoogleVeoProvider(BaseVideoProvider):
 
         elif "video_base64" in result.generation_params:
             # Decode base64
-            import base64
-            video_data = base64.b64decode(result.generation_params["video_base64"])
+            video_data = decode_base64(result.generation_params["video_base64"])
             with open(output_path, "wb") as f:
                 f.write(video_data)
         else:
@@ -372,6 +372,42 @@ class ReferenceManager:
         logger.debug(f"Saved {frame_type} frame for {scene_id}: {frame_path}")
         return str(frame_path)
 
+    def save_extracted_frame_from_path(
+        self,
+        scene_id: str,
+        source_path: Union[str, Path],
+        frame_type: str = "last",  # first, last, thumbnail
+    ) -> str:
+        """
+        Save an extracted frame by copying an existing image file.
+
+        The copy is done by shutil.copyfile, which uses the kernel's
+        copy_file_range/sendfile on Linux, so the image is never read
+        into memory.
+
+        Args:
+            scene_id: Scene identifier
+            source_path: Path to the extracted frame image
+            frame_type: Type of frame (first, last, thumbnail)
+
+        Returns:
+            Path to saved frame
+        """
+        source_path = Path(source_path)
+
+        # Create scene directory
+        scene_path = self.frames_path / scene_id
+        scene_path.mkdir(parents=True, exist_ok=True)
+
+        # Save frame, keeping the source image format
+        format = source_path.suffix.lstrip(".").lower() or "jpg"
+        frame_path = scene_path / f"{frame_type}_frame.{format}"
+
+        shutil.copyfile(source_path, frame_path)
+
+        logger.debug(f"Saved {frame_type} frame for {scene_id}: {frame_path}")
+        return str(frame_path)
+
     def get_last_frame(self, scene_id: str) -> Optional[str]:
         """Get the last frame path for a scene."""
         scene_path = self.frames_path / scene_id
@@ -392,6 +392,20 @@ class SceneTracker:
 
         return sorted(latest_scenes.values(), key=lambda s: s.scene_number)
 
+    def get_max_scene_number(self, episode_id: str) -> Optional[int]:
+        """Get the highest scene number in an episode (None if it has no scenes)."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT MAX(scene_number) FROM scenes WHERE episode_id = ?",
+            (episode_id,),
+        )
+        (max_number,) = cursor.fetchone()
+        conn.close()
+
+        return max_number
+
     def get_last_scene_in_episode(self, episode_id: str) -> Optional[Scene]:
         """Get the last scene in an episode."""
         scenes = self.get_scenes_for_episode(episode_id)
@@ -12,7 +12,7 @@ This module provides a clean, simplified interface for:
 """
 
 from .builder import SeriesBuilder
-from .series import Series, Episode, Scene
+from .series import Series, SeriesConfig, Episode, Scene
 from .character import Character, CharacterStyle
 from .style import VisualStyle, QualityPreset
 
@@ -21,6 +21,7 @@ __all__ = [
     "SeriesBuilder",
     # Core models
     "Series",
+    "SeriesConfig",
     "Episode",
     "Scene",
     "Character",
@@ -10,16 +10,84 @@ with all its characters, style settings, and production configuration.
 
 import json
 import logging
-import yaml
+import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Callable, Set, Union
 
-from .series import Series, Episode, Scene, SeriesStatus
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .series import Series, SeriesConfig, Episode, Scene, SeriesStatus
 from .character import Character, CharacterBuilder, CharacterType
 from .style import VisualStyle, QualityPreset, StylePresets
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for streamed config I/O
+_IO_BUFFER_SIZE = 1 << 20
+
+# Output directories already created by save() in this process
+_KNOWN_DIRS: Set[Path] = set()
+
+# Value -> member table, avoids Enum.__call__ on the common path
+_QUALITY_PRESETS: Dict[str, QualityPreset] = {p.value: p for p in QualityPreset}
+
+
+def _quality_preset(value: str) -> QualityPreset:
+    """Resolve a quality preset by value (raises ValueError if unknown)."""
+    return _QUALITY_PRESETS.get(value) or QualityPreset(value)
+
+
+# Style preset factories by name (each call returns a fresh VisualStyle)
+_STYLE_PRESETS: Dict[str, Callable[[], VisualStyle]] = {
+    "cinematic": StylePresets.cinematic,
+    "anime": StylePresets.anime,
+    "documentary": StylePresets.documentary,
+    "noir": StylePresets.noir,
+    "scifi": StylePresets.scifi,
+}
+
+
+def _import_yaml():
+    """
+    Import PyYAML on first use.
+
+    Returns the module with the fastest available safe dumper and loader
+    (libyaml's C implementations when compiled in).
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper, SafeLoader as Loader
+
+    return yaml, Dumper, Loader
+
+
+def _write_config(path: Path, data: Dict[str, Any]) -> None:
+    """Write export data as YAML or JSON based on the file extension."""
+    if path.suffix in (".yaml", ".yml"):
+        yaml, Dumper, _ = _import_yaml()
+        with open(path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+            yaml.dump(
+                data,
+                f,
+                Dumper=Dumper,
+                encoding="utf-8",
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
+    elif HAS_ORJSON:
+        # Serialized in one piece, so a single unbuffered write suffices
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+
 
 class SeriesBuilder:
     """
@@ -73,29 +141,19 @@ class SeriesBuilder:
         Args:
             name: Name of the series
         """
-        self._name = name
-        self._description = ""
-        self._genre = ""
-
-        # Characters
-        self._characters: Dict[str, Character] = {}
-
-        # Locations
-        self._locations: Dict[str, Dict[str, Any]] = {}
-
-        # Style
-        self._style: Optional[VisualStyle] = None
-        self._quality_preset: QualityPreset = QualityPreset.BALANCED
+        self._config = SeriesConfig(name=name)
 
-        # Production settings
-        self._provider = "fal"
-        self._model = "kling-2.5"
-        self._duration = 5
-        self._aspect_ratio = "16:9"
-        self._output_path = "./output"
+    @classmethod
+    def from_config(cls, config: SeriesConfig) -> "SeriesBuilder":
+        """Create a builder around an existing SeriesConfig."""
+        builder = cls(config.name)
+        builder._config = config
+        return builder
 
-        # Episodes (pre-planned)
-        self._episodes: List[Episode] = []
+    @property
+    def config(self) -> SeriesConfig:
+        """The configuration collected so far."""
+        return self._config
 
     # -------------------------------------------------------------------------
     # Basic Metadata
@@ -103,12 +161,12 @@ class SeriesBuilder:
 
     def description(self, description: str) -> "SeriesBuilder":
         """Set series description."""
-        self._description = description
+        self._config.description = description
         return self
 
     def genre(self, genre: str) -> "SeriesBuilder":
         """Set series genre."""
-        self._genre = genre
+        self._config.genre = genre
         return self
 
     # -------------------------------------------------------------------------
@@ -117,7 +175,7 @@ class SeriesBuilder:
 
     def character(self, character: Character) -> "SeriesBuilder":
         """Add a character to the series."""
-        self._characters[character.character_id] = character
+        self._config.characters[character.character_id] = character
         return self
 
     def protagonist(
@@ -140,7 +198,7 @@ class SeriesBuilder:
             character_type=CharacterType.PROTAGONIST,
             **kwargs,
         )
-        self._characters[character_id] = char
+        self._config.characters[character_id] = char
         return self
 
     def supporting_character(
@@ -156,7 +214,7 @@ class SeriesBuilder:
             character_type=CharacterType.SUPPORTING,
             **kwargs,
         )
-        self._characters[character_id] = char
+        self._config.characters[character_id] = char
         return self
 
     # -------------------------------------------------------------------------
@@ -180,7 +238,7 @@ class SeriesBuilder:
             description: Prompt-friendly description
             reference_image: Reference image path
         """
-        self._locations[location_id] = {
+        self._config.locations[location_id] = {
             "name": name,
             "description": description,
             "reference_image": reference_image,
@@ -194,52 +252,52 @@ class SeriesBuilder:
 
     def style(self, style: VisualStyle) -> "SeriesBuilder":
         """Set the visual style."""
-        self._style = style
+        self._config.style = style
         return self
 
     def cinematic_style(self) -> "SeriesBuilder":
         """Use cinematic style preset."""
-        self._style = StylePresets.cinematic()
+        self._config.style = StylePresets.cinematic()
         return self
 
     def anime_style(self) -> "SeriesBuilder":
         """Use anime style preset."""
-        self._style = StylePresets.anime()
+        self._config.style = StylePresets.anime()
         return self
 
     def documentary_style(self) -> "SeriesBuilder":
         """Use documentary style preset."""
-        self._style = StylePresets.documentary()
+        self._config.style = StylePresets.documentary()
         return self
 
     def noir_style(self) -> "SeriesBuilder":
         """Use noir style preset."""
-        self._style = StylePresets.noir()
+        self._config.style = StylePresets.noir()
         return self
 
     def scifi_style(self) -> "SeriesBuilder":
         """Use sci-fi style preset."""
-        self._style = StylePresets.scifi()
+        self._config.style = StylePresets.scifi()
         return self
 
     def quality(self, preset: QualityPreset) -> "SeriesBuilder":
         """Set quality preset."""
-        self._quality_preset = preset
+        self._config.quality_preset = preset
         return self
 
     def draft_quality(self) -> "SeriesBuilder":
         """Use draft quality for fast iteration."""
-        self._quality_preset = QualityPreset.DRAFT
+        self._config.quality_preset = QualityPreset.DRAFT
         return self
 
     def high_quality(self) -> "SeriesBuilder":
         """Use high quality preset."""
-        self._quality_preset = QualityPreset.HIGH
+        self._config.quality_preset = QualityPreset.HIGH
         return self
 
     def cinematic_quality(self) -> "SeriesBuilder":
         """Use cinematic quality preset."""
-        self._quality_preset = QualityPreset.CINEMATIC
+        self._config.quality_preset = QualityPreset.CINEMATIC
         return self
 
     # -------------------------------------------------------------------------
@@ -248,42 +306,42 @@ class SeriesBuilder:
 
     def provider(self, provider: str) -> "SeriesBuilder":
         """Set the video generation provider."""
-        self._provider = provider
+        self._config.provider = sys.intern(provider)
         return self
 
     def model(self, model: str) -> "SeriesBuilder":
         """Set the video generation model."""
-        self._model = model
+        self._config.model = sys.intern(model)
         return self
 
     def duration(self, seconds: int) -> "SeriesBuilder":
         """Set default scene duration."""
-        self._duration = seconds
+        self._config.duration = seconds
         return self
 
     def aspect_ratio(self, ratio: str) -> "SeriesBuilder":
         """Set default aspect ratio."""
-        self._aspect_ratio = ratio
+        self._config.aspect_ratio = sys.intern(ratio)
         return self
 
     def widescreen(self) -> "SeriesBuilder":
         """Use 16:9 widescreen."""
-        self._aspect_ratio = "16:9"
+        self._config.aspect_ratio = "16:9"
         return self
 
     def vertical(self) -> "SeriesBuilder":
         """Use 9:16 vertical (social media)."""
-        self._aspect_ratio = "9:16"
+        self._config.aspect_ratio = "9:16"
         return self
 
     def square(self) -> "SeriesBuilder":
         """Use 1:1 square."""
-        self._aspect_ratio = "1:1"
+        self._config.aspect_ratio = "1:1"
         return self
 
     def output_path(self, path: Union[str, Path]) -> "SeriesBuilder":
         """Set output directory."""
-        self._output_path = str(path)
+        self._config.output_path = str(path)
         return self
 
     # -------------------------------------------------------------------------
@@ -305,25 +363,29 @@ class SeriesBuilder:
             scenes: List of scene definitions
         """
         episode = Episode(
-            episode_number=len(self._episodes) + 1,
+            episode_number=len(self._config.episodes) + 1,
             title=title,
             description=description,
         )
 
         if scenes:
-            for i, scene_def in enumerate(scenes):
-                scene = Scene(
-                    scene_number=i + 1,
-                    action=scene_def.get("action", ""),
-                    character_ids=scene_def.get("character_ids", [scene_def.get("character_id")]) if scene_def.get("character_id") or scene_def.get("character_ids") else [],
-                    location_id=scene_def.get("location_id"),
-                    duration=scene_def.get("duration", self._duration),
-                    camera_direction=scene_def.get("camera"),
-                    dialogue=scene_def.get("dialogue"),
-                )
-                episode.scenes.append(scene)
-
-        self._episodes.append(episode)
+            default_duration = self._config.duration
+            append_scene = episode.scenes.append
+            for i, scene_def in enumerate(scenes, 1):
+                get = scene_def.get
+                character_id = get("character_id")
+                character_ids = get("character_ids")
+                append_scene(Scene(
+                    scene_number=i,
+                    action=get("action", ""),
+                    character_ids=character_ids or ([character_id] if character_id else []),
+                    location_id=get("location_id"),
+                    duration=get("duration", default_duration),
+                    camera_direction=get("camera"),
+                    dialogue=get("dialogue"),
+                ))
+
+        self._config.episodes.append(episode)
         return self
 
     # -------------------------------------------------------------------------
@@ -332,29 +394,7 @@ class SeriesBuilder:
 
     def build(self) -> Series:
         """Build the series."""
-        # Apply quality preset settings
-        quality_settings = self._quality_preset.get_settings()
-
-        series = Series(
-            name=self._name,
-            description=self._description,
-            genre=self._genre,
-            character_ids=list(self._characters.keys()),
-            default_provider=self._provider,
-            default_model=quality_settings.get("model", self._model),
-            default_duration=self._duration,
-            default_aspect_ratio=self._aspect_ratio,
-            quality_preset=self._quality_preset.value,
-            output_path=self._output_path,
-            episodes=self._episodes,
-        )
-
-        # Store full character data for export
-        series._characters = self._characters
-        series._locations = self._locations
-        series._style = self._style or StylePresets.cinematic()
-
-        return series
+        return Series.from_config(self._config)
 
     def save(self, path: Union[str, Path]) -> "SeriesBuilder":
         """
@@ -365,22 +405,27 @@ class SeriesBuilder:
         """
         series = self.build()
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+
+        parent = path.parent
+        if parent not in _KNOWN_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _KNOWN_DIRS.add(parent)
 
         data = self._to_export_format(series)
 
-        if path.suffix in (".yaml", ".yml"):
-            with open(path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-        else:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+        try:
+            _write_config(path, data)
+        except FileNotFoundError:
+            # Cached directory was removed externally
+            parent.mkdir(parents=True, exist_ok=True)
+            _write_config(path, data)
 
-        logger.info(f"Series configuration saved to: {path}")
+        logger.info("Series configuration saved to: %s", path)
         return self
 
     def _to_export_format(self, series: Series) -> Dict[str, Any]:
         """Convert to export format."""
+        config = self._config
         return {
             "series": {
                 "name": series.name,
@@ -389,18 +434,18 @@ class SeriesBuilder:
             },
             "characters": {
                 cid: char.to_dict()
-                for cid, char in self._characters.items()
+                for cid, char in config.characters.items()
             },
-            "locations": self._locations,
-            "visual_style": self._style.to_dict() if self._style else {},
+            "locations": config.locations,
+            "visual_style": config.style.to_dict() if config.style else {},
             "production": {
-                "provider": self._provider,
-                "model": self._model,
-                "quality_preset": self._quality_preset.value,
-                "default_duration": self._duration,
-                "default_aspect_ratio": self._aspect_ratio,
+                "provider": config.provider,
+                "model": config.model,
+                "quality_preset": config.quality_preset.value,
+                "default_duration": config.duration,
+                "default_aspect_ratio": config.aspect_ratio,
             },
-            "episodes": [ep.to_dict() for ep in self._episodes],
+            "episodes": list(map(Episode.to_dict, config.episodes)),
         }
 
     @classmethod
@@ -419,43 +464,39 @@ class SeriesBuilder:
         if not path.exists():
             raise FileNotFoundError(f"Series config not found: {path}")
 
-        with open(path, "r") as f:
-            if path.suffix in (".yaml", ".yml"):
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
+        if path.suffix in (".yaml", ".yml"):
+            yaml, _, Loader = _import_yaml()
+            with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                data = yaml.load(f, Loader=Loader)
+        elif HAS_ORJSON:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_bytes())
 
         # Build from loaded data
         series_data = data.get("series", {})
-        builder = cls(series_data.get("name", "Untitled"))
-        builder._description = series_data.get("description", "")
-        builder._genre = series_data.get("genre", "")
-
-        # Characters
-        for cid, char_data in data.get("characters", {}).items():
-            char = Character.from_dict({**char_data, "character_id": cid})
-            builder._characters[cid] = char
-
-        # Locations
-        builder._locations = data.get("locations", {})
-
-        # Style
         style_data = data.get("visual_style", {})
-        if style_data:
-            builder._style = VisualStyle.from_dict(style_data)
-
-        # Production settings
         prod = data.get("production", {})
-        builder._provider = prod.get("provider", "fal")
-        builder._model = prod.get("model", "kling-2.5")
-        builder._duration = prod.get("default_duration", 5)
-        builder._aspect_ratio = prod.get("default_aspect_ratio", "16:9")
 
-        preset_name = prod.get("quality_preset", "balanced")
-        builder._quality_preset = QualityPreset(preset_name)
+        config = SeriesConfig(
+            name=series_data.get("name", "Untitled"),
+            description=series_data.get("description", ""),
+            genre=series_data.get("genre", ""),
+            characters={
+                cid: Character.from_dict(char_data, character_id=cid)
+                for cid, char_data in data.get("characters", {}).items()
+            },
+            locations=data.get("locations", {}),
+            style=VisualStyle.from_dict(style_data) if style_data else None,
+            quality_preset=_quality_preset(prod.get("quality_preset", "balanced")),
+            provider=sys.intern(prod.get("provider", "fal")),
+            model=sys.intern(prod.get("model", "kling-2.5")),
+            duration=prod.get("default_duration", 5),
+            aspect_ratio=sys.intern(prod.get("default_aspect_ratio", "16:9")),
+        )
 
-        logger.info(f"Loaded series configuration from: {path}")
-        return builder
+        logger.info("Loaded series configuration from: %s", path)
+        return cls.from_config(config)
 
 
 # =============================================================================
@@ -524,17 +565,10 @@ def quick_series(
     builder = SeriesBuilder(name)
 
     # Style
-    style_map = {
-        "cinematic": StylePresets.cinematic(),
-        "anime": StylePresets.anime(),
-        "documentary": StylePresets.documentary(),
-        "noir": StylePresets.noir(),
-        "scifi": StylePresets.scifi(),
-    }
-    builder._style = style_map.get(style, StylePresets.cinematic())
+    builder._config.style = _STYLE_PRESETS.get(style, StylePresets.cinematic)()
 
     # Quality
-    builder._quality_preset = QualityPreset(quality)
+    builder._config.quality_preset = _quality_preset(quality)
 
     # Protagonist
     builder.protagonist(
@@ -6,10 +6,12 @@ Character definition and styling for consistent identity across generations.
 """
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +25,17 @@ class CharacterType(Enum):
     BACKGROUND = "background"
 
 
-@dataclass
+# Value -> member table, avoids Enum.__call__ on the common path
+_CHARACTER_TYPES: Dict[str, CharacterType] = {t.value: t for t in CharacterType}
+
+# Scalar fields the appearance fragment is built from (features compared separately)
+_appearance_key = attrgetter(
+    "age_range", "gender", "ethnicity", "body_type",
+    "hair_color", "hair_style", "eye_color", "facial_hair",
+)
+
+
+@dataclass(slots=True)
 class CharacterStyle:
     """
     Visual styling for a character.
@@ -54,8 +66,37 @@ class CharacterStyle:
     voice_description: str = ""
     mannerisms: List[str] = field(default_factory=list)
 
+    # Cached (appearance key, distinguishing_features snapshot, fragment
+    # without outfit); validated on read, so field writes stay plain
+    _fragment_cache: Optional[Tuple[Tuple[str, ...], List[str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def build_prompt_fragment(self, include_outfit: bool = True) -> str:
         """Build a prompt fragment describing this character's appearance."""
+        cache = self._fragment_cache
+        key = _appearance_key(self)
+        # Features can be appended in place, so compare against the snapshot
+        if (
+            cache is None
+            or cache[0] != key
+            or cache[1] != self.distinguishing_features
+        ):
+            cache = (
+                key,
+                list(self.distinguishing_features),
+                self._build_base_fragment(),
+            )
+            self._fragment_cache = cache
+
+        base = cache[2]
+        if include_outfit and self.default_outfit:
+            outfit = f"wearing {self.default_outfit}"
+            return f"{base}, {outfit}" if base else outfit
+        return base
+
+    def _build_base_fragment(self) -> str:
+        """Build the appearance fragment, excluding the outfit."""
         parts = []
 
         # Demographics
@@ -86,10 +127,6 @@ class CharacterStyle:
         if self.distinguishing_features:
             parts.extend(self.distinguishing_features)
 
-        # Outfit
-        if include_outfit and self.default_outfit:
-            parts.append(f"wearing {self.default_outfit}")
-
         return ", ".join(parts)
 
     def get_outfit(self, variant: Optional[str] = None) -> str:
@@ -120,25 +157,68 @@ class CharacterStyle:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CharacterStyle":
         """Create from dictionary."""
-        return cls(
-            age_range=data.get("age_range", ""),
-            gender=data.get("gender", ""),
-            ethnicity=data.get("ethnicity", ""),
-            body_type=data.get("body_type", ""),
-            face_shape=data.get("face_shape", ""),
-            eye_color=data.get("eye_color", ""),
-            hair_color=data.get("hair_color", ""),
-            hair_style=data.get("hair_style", ""),
-            facial_hair=data.get("facial_hair", ""),
-            distinguishing_features=data.get("distinguishing_features", []),
-            default_outfit=data.get("default_outfit", ""),
-            outfit_variants=data.get("outfit_variants", {}),
-            voice_description=data.get("voice_description", ""),
-            mannerisms=data.get("mannerisms", []),
-        )
+        # Unknown keys are ignored, missing ones fall back to field defaults
+        return cls(**{k: v for k, v in data.items() if k in _CHARACTER_STYLE_FIELDS})
+
 
+# Field names accepted by CharacterStyle.from_dict
+_CHARACTER_STYLE_FIELDS = frozenset(f.name for f in fields(CharacterStyle) if f.init)
+
+
+@lru_cache(maxsize=1024)
+def _build_prompt(
+    name: str,
+    style_fragment: str,
+    outfit: Optional[str],
+    prompt_prefix: str,
+    prompt_suffix: str,
+    action: str,
+    location: Optional[str],
+    camera: Optional[str],
+) -> str:
+    """
+    Assemble a character prompt from already-resolved parts.
 
-@dataclass
+    Pure function of its (hashable) arguments, so repeated scenes with the
+    same character, action and framing are served from the cache.
+    """
+    parts = []
+
+    # Prefix
+    if prompt_prefix:
+        parts.append(prompt_prefix)
+
+    # Character identity
+    identity = f"{name}"
+    if style_fragment:
+        identity += f", {style_fragment}"
+
+    # Outfit override
+    if outfit:
+        identity += f", wearing {outfit}"
+
+    parts.append(identity)
+
+    # Action
+    if action:
+        parts.append(action)
+
+    # Location
+    if location:
+        parts.append(f"in {location}")
+
+    # Camera
+    if camera:
+        parts.append(f", {camera}")
+
+    # Suffix
+    if prompt_suffix:
+        parts.append(prompt_suffix)
+
+    return ", ".join(filter(None, parts))
+
+
+@dataclass(slots=True)
 class Character:
     """
     A character in the video series.
@@ -195,44 +275,19 @@ class Character:
         Returns:
             Complete prompt string
         """
-        parts = []
-
-        # Prefix
-        if self.prompt_prefix:
-            parts.append(self.prompt_prefix)
-
-        # Character identity
-        identity = f"{self.name}"
-        if include_style:
-            style_desc = self.style.build_prompt_fragment()
-            if style_desc:
-                identity += f", {style_desc}"
-
-        # Outfit override
-        if outfit_variant:
-            outfit = self.style.get_outfit(outfit_variant)
-            if outfit:
-                identity += f", wearing {outfit}"
-
-        parts.append(identity)
-
-        # Action
-        if action:
-            parts.append(action)
-
-        # Location
-        if location:
-            parts.append(f"in {location}")
-
-        # Camera
-        if camera:
-            parts.append(f", {camera}")
-
-        # Suffix
-        if self.prompt_suffix:
-            parts.append(self.prompt_suffix)
-
-        return ", ".join(filter(None, parts))
+        style_fragment = self.style.build_prompt_fragment() if include_style else ""
+        outfit = self.style.get_outfit(outfit_variant) if outfit_variant else None
+
+        return _build_prompt(
+            self.name,
+            style_fragment,
+            outfit,
+            self.prompt_prefix,
+            self.prompt_suffix,
+            action,
+            location,
+            camera,
+        )
 
     def get_reference_image(self, view: str = "front") -> Optional[str]:
         """Get a reference image path for the specified view."""
@@ -245,6 +300,10 @@ class Character:
         # Prefer front view, then any available
         return self.reference_images.get("front") or next(iter(self.reference_images.values()))
 
+    def add_reference(self, view: str, path: str) -> None:
+        """Add or replace a reference image for a view."""
+        self.reference_images[view] = path
+
     def get_all_references(self, max_images: int = 4) -> List[str]:
         """Get all reference images up to the limit."""
         refs = list(self.reference_images.values())
@@ -268,13 +327,28 @@ class Character:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Character":
-        """Create Character from dictionary."""
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        character_id: Optional[str] = None,
+    ) -> "Character":
+        """
+        Create Character from dictionary.
+
+        Args:
+            data: Serialized character data
+            character_id: Overrides data["character_id"] when given
+        """
+        if character_id is None:
+            character_id = data.get("character_id", "")
+        character_type = data.get("character_type", "supporting")
         return cls(
-            character_id=data.get("character_id", ""),
+            character_id=character_id,
             name=data.get("name", ""),
             role=data.get("role", ""),
-            character_type=CharacterType(data.get("character_type", "supporting")),
+            character_type=(
+                _CHARACTER_TYPES.get(character_type) or CharacterType(character_type)
+            ),
             description=data.get("description", ""),
             backstory=data.get("backstory", ""),
             personality_traits=data.get("personality_traits", []),
@@ -285,6 +359,34 @@ class Character:
             preferred_seed=data.get("preferred_seed"),
         )
 
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "Character":
+        """
+        Create Character from field values in a single constructor call.
+
+        Cheaper than a CharacterBuilder chain for bulk imports. Keys are
+        Character field names; "style" may be a CharacterStyle or a dict of
+        its fields and "character_type" may be given as its string value.
+        Unknown keys are ignored.
+
+        Args:
+            spec: Mapping of field names to values
+        """
+        kwargs = {k: v for k, v in spec.items() if k in _CHARACTER_FIELDS}
+        style = kwargs.get("style")
+        if isinstance(style, dict):
+            kwargs["style"] = CharacterStyle.from_dict(style)
+        character_type = kwargs.get("character_type")
+        if isinstance(character_type, str):
+            kwargs["character_type"] = (
+                _CHARACTER_TYPES.get(character_type) or CharacterType(character_type)
+            )
+        return cls(**kwargs)
+
+
+# Field names accepted by Character.from_spec
+_CHARACTER_FIELDS = frozenset(f.name for f in fields(Character) if f.init)
+
 
 # =============================================================================
 # Character Builder for Fluent Interface
@@ -310,42 +412,38 @@ class CharacterBuilder:
             .reference("side", "refs/alex_side.jpg")
             .build()
         )
+
+    For bulk or programmatic creation use Character.from_spec instead.
     """
 
     def __init__(self, character_id: str):
-        self._character_id = character_id
-        self._name = ""
-        self._role = ""
-        self._type = CharacterType.SUPPORTING
-        self._description = ""
-        self._style = CharacterStyle()
-        self._references: Dict[str, str] = {}
-        self._prompt_prefix = ""
-        self._prompt_suffix = ""
+        # Setters write straight into the character that build() returns
+        self._character = Character(character_id=character_id)
+        self._style = self._character.style
 
     def name(self, name: str) -> "CharacterBuilder":
         """Set character name."""
-        self._name = name
+        self._character.name = name
         return self
 
     def role(self, role: str) -> "CharacterBuilder":
         """Set character role."""
-        self._role = role
+        self._character.role = role
         return self
 
     def as_protagonist(self) -> "CharacterBuilder":
         """Set as protagonist."""
-        self._type = CharacterType.PROTAGONIST
+        self._character.character_type = CharacterType.PROTAGONIST
         return self
 
     def as_antagonist(self) -> "CharacterBuilder":
         """Set as antagonist."""
-        self._type = CharacterType.ANTAGONIST
+        self._character.character_type = CharacterType.ANTAGONIST
         return self
 
     def description(self, description: str) -> "CharacterBuilder":
         """Set narrative description."""
-        self._description = description
+        self._character.description = description
         return self
 
     def age(self, age_range: str) -> "CharacterBuilder":
@@ -401,29 +499,19 @@ class CharacterBuilder:
 
     def reference(self, view: str, path: str) -> "CharacterBuilder":
         """Add a reference image."""
-        self._references[view] = path
+        self._character.add_reference(view, path)
         return self
 
     def prompt_prefix(self, prefix: str) -> "CharacterBuilder":
         """Set prompt prefix."""
-        self._prompt_prefix = prefix
+        self._character.prompt_prefix = prefix
         return self
 
     def prompt_suffix(self, suffix: str) -> "CharacterBuilder":
         """Set prompt suffix."""
-        self._prompt_suffix = suffix
+        self._character.prompt_suffix = suffix
         return self
 
     def build(self) -> Character:
         """Build the character."""
-        return Character(
-            character_id=self._character_id,
-            name=self._name,
-            role=self._role,
-            character_type=self._type,
-            description=self._description,
-            style=self._style,
-            reference_images=self._references,
-            prompt_prefix=self._prompt_prefix,
-            prompt_suffix=self._prompt_suffix,
-        )
+        return self._character
@@ -5,16 +5,44 @@ Series Models
 Core data models for series, episodes, and scenes.
 """
 
-import uuid
+import json
 import logging
+import secrets
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .character import Character
+from .style import VisualStyle, QualityPreset, StylePresets
 
 logger = logging.getLogger(__name__)
 
+# Interned defaults shared by every model instance and loaded series
+_DEFAULT_PROVIDER = sys.intern("fal")
+_DEFAULT_MODEL = sys.intern("kling-2.5")
+_DEFAULT_ASPECT_RATIO = sys.intern("16:9")
+_DEFAULT_QUALITY_PRESET = sys.intern("balanced")
+
+
+def _short_id() -> str:
+    """Generate an 8-character hex identifier."""
+    return secrets.token_hex(4)
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format a UNIX timestamp as a local-time ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
 
 class SeriesStatus(Enum):
     """Status of a series."""
@@ -45,7 +73,12 @@ class SceneStatus(Enum):
     NEEDS_REVISION = "needs_revision"
 
 
-@dataclass
+# Value -> member tables, avoid Enum.__call__ when loading many scenes
+_EPISODE_STATUSES: Dict[str, EpisodeStatus] = {s.value: s for s in EpisodeStatus}
+_SCENE_STATUSES: Dict[str, SceneStatus] = {s.value: s for s in SceneStatus}
+
+
+@dataclass(slots=True)
 class Scene:
     """
     A single scene within an episode.
@@ -55,7 +88,7 @@ class Scene:
     """
 
     # Identity
-    scene_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    scene_id: str = field(default_factory=_short_id)
     scene_number: int = 1
     take_number: int = 1
 
@@ -74,7 +107,7 @@ class Scene:
 
     # Technical
     duration: int = 5  # seconds
-    aspect_ratio: str = "16:9"
+    aspect_ratio: str = _DEFAULT_ASPECT_RATIO
     with_audio: bool = False
 
     # Generation
@@ -91,8 +124,8 @@ class Scene:
     thumbnail_path: Optional[str] = None
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    completed_at: Optional[datetime] = None
+    created_at: float = field(default_factory=time.time)  # UNIX timestamp
+    completed_at: Optional[float] = None
     generation_time_seconds: Optional[float] = None
     provider: Optional[str] = None
     model: Optional[str] = None
@@ -113,12 +146,28 @@ class Scene:
             "status": self.status.value,
             "video_path": self.video_path,
             "video_url": self.video_url,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": _isoformat(self.created_at),
+            "completed_at": _isoformat(self.completed_at) if self.completed_at is not None else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Scene":
+        """Create Scene from dictionary."""
+        get = data.get
+        status = get("status", "pending")
+        return cls(
+            scene_id=get("scene_id"),
+            scene_number=get("scene_number", 1),
+            action=get("action", ""),
+            character_ids=get("character_ids", []),
+            location_id=get("location_id"),
+            duration=get("duration", 5),
+            status=_SCENE_STATUSES.get(status) or SceneStatus(status),
+            video_path=get("video_path"),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class Episode:
     """
     An episode containing multiple scenes.
@@ -128,7 +177,7 @@ class Episode:
     """
 
     # Identity
-    episode_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    episode_id: str = field(default_factory=_short_id)
     episode_number: int = 1
     title: str = ""
     description: str = ""
@@ -146,23 +195,45 @@ class Episode:
     combined_video_path: Optional[str] = None
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    completed_at: Optional[datetime] = None
+    created_at: float = field(default_factory=time.time)  # UNIX timestamp
+    completed_at: Optional[float] = None
     tags: List[str] = field(default_factory=list)
 
+    # scene_id -> position in scenes; hits are checked against the list,
+    # so direct edits to scenes never return a stale Scene
+    _scene_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def add_scene(self, scene: Scene) -> None:
         """Add a scene to the episode."""
         scene.scene_number = len(self.scenes) + 1
+        self._scene_index.setdefault(scene.scene_id, len(self.scenes))
         self.scenes.append(scene)
         self._update_estimated_duration()
 
     def get_scene(self, scene_id: str) -> Optional[Scene]:
         """Get a scene by ID."""
-        for scene in self.scenes:
+        scenes = self.scenes
+        i = self._scene_index.get(scene_id)
+        if i is not None and i < len(scenes) and scenes[i].scene_id == scene_id:
+            return scenes[i]
+
+        # Unknown ID, or the list was edited directly: scan, and reindex
+        # only if the scene turns up
+        for scene in scenes:
             if scene.scene_id == scene_id:
+                self._reindex_scenes()
                 return scene
         return None
 
+    def _reindex_scenes(self) -> None:
+        """Rebuild the scene index (first scene wins on duplicate IDs)."""
+        index: Dict[str, int] = {}
+        for i, scene in enumerate(self.scenes):
+            index.setdefault(scene.scene_id, i)
+        self._scene_index = index
+
     def get_pending_scenes(self) -> List[Scene]:
         """Get all scenes that need generation."""
         return [s for s in self.scenes if s.status == SceneStatus.PENDING]
@@ -182,14 +253,61 @@ class Episode:
             "episode_number": self.episode_number,
             "title": self.title,
             "description": self.description,
-            "scenes": [s.to_dict() for s in self.scenes],
+            "scenes": list(map(Scene.to_dict, self.scenes)),
             "status": self.status.value,
             "estimated_duration_seconds": self.estimated_duration_seconds,
-            "created_at": self.created_at.isoformat(),
+            "created_at": _isoformat(self.created_at),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Episode":
+        """Create Episode (and its scenes) from dictionary."""
+        get = data.get
+        status = get("status", "planned")
+        return cls(
+            episode_id=get("episode_id"),
+            episode_number=get("episode_number", 1),
+            title=get("title", ""),
+            description=get("description", ""),
+            status=_EPISODE_STATUSES.get(status) or EpisodeStatus(status),
+            scenes=list(map(Scene.from_dict, get("scenes", ()))),
+        )
+
+
+@dataclass(slots=True)
+class SeriesConfig:
+    """
+    Flat configuration for a series.
+
+    Holds everything SeriesBuilder collects, so a series can also be
+    declared in a single constructor call and passed to Series.from_config.
+    """
+
+    # Metadata
+    name: str = ""
+    description: str = ""
+    genre: str = ""
+
+    # Characters and locations
+    characters: Dict[str, Character] = field(default_factory=dict)
+    locations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Style
+    style: Optional[VisualStyle] = None
+    quality_preset: QualityPreset = QualityPreset.BALANCED
 
-@dataclass
+    # Production settings
+    provider: str = _DEFAULT_PROVIDER
+    model: str = _DEFAULT_MODEL
+    duration: int = 5
+    aspect_ratio: str = _DEFAULT_ASPECT_RATIO
+    output_path: str = "./output"
+
+    # Episodes (pre-planned)
+    episodes: List[Episode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class Series:
     """
     A video series containing multiple episodes.
@@ -203,7 +321,7 @@ class Series:
     """
 
     # Identity
-    series_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    series_id: str = field(default_factory=_short_id)
     name: str = ""
     description: str = ""
     genre: str = ""
@@ -216,49 +334,99 @@ class Series:
 
     # Production settings
     status: SeriesStatus = SeriesStatus.DRAFT
-    default_provider: str = "fal"
-    default_model: str = "kling-2.5"
+    default_provider: str = _DEFAULT_PROVIDER
+    default_model: str = _DEFAULT_MODEL
     default_duration: int = 5
-    default_aspect_ratio: str = "16:9"
+    default_aspect_ratio: str = _DEFAULT_ASPECT_RATIO
 
     # Quality settings
-    quality_preset: str = "balanced"
+    quality_preset: str = _DEFAULT_QUALITY_PRESET
     target_consistency_score: float = 0.8
 
     # Output
     output_path: Optional[str] = None
 
     # Metadata
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.time)  # UNIX timestamp
+    updated_at: float = field(default_factory=time.time)
     tags: List[str] = field(default_factory=list)
     version: str = "1.0.0"
 
+    # Episode ID / number -> position in episodes; hits are checked
+    # against the list, so direct edits never return a stale Episode
+    _episode_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _episode_number_index: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Full character, location and style data (set by from_config, used for export)
+    _characters: Dict[str, Character] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _locations: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _style: Optional[VisualStyle] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def add_episode(self, episode: Episode) -> None:
         """Add an episode to the series."""
         episode.episode_number = len(self.episodes) + 1
+        position = len(self.episodes)
         self.episodes.append(episode)
-        self.updated_at = datetime.now()
+        self._episode_index.setdefault(episode.episode_id, position)
+        self._episode_number_index.setdefault(episode.episode_number, position)
+        self.updated_at = time.time()
 
     def get_episode(self, episode_id: str) -> Optional[Episode]:
         """Get an episode by ID."""
-        for episode in self.episodes:
+        episodes = self.episodes
+        i = self._episode_index.get(episode_id)
+        if i is not None and i < len(episodes) and episodes[i].episode_id == episode_id:
+            return episodes[i]
+
+        # Unknown ID, or the list was edited directly
+        for episode in episodes:
             if episode.episode_id == episode_id:
+                self._reindex_episodes()
                 return episode
         return None
 
     def get_episode_by_number(self, number: int) -> Optional[Episode]:
         """Get an episode by number."""
-        for episode in self.episodes:
+        episodes = self.episodes
+        i = self._episode_number_index.get(number)
+        if i is not None and i < len(episodes) and episodes[i].episode_number == number:
+            return episodes[i]
+
+        # Unknown number, or the list was edited directly
+        for episode in episodes:
             if episode.episode_number == number:
+                self._reindex_episodes()
                 return episode
         return None
 
+    def _reindex_episodes(self) -> None:
+        """Rebuild the episode indexes (first episode wins on duplicates)."""
+        by_id: Dict[str, int] = {}
+        by_number: Dict[int, int] = {}
+        for i, episode in enumerate(self.episodes):
+            by_id.setdefault(episode.episode_id, i)
+            by_number.setdefault(episode.episode_number, i)
+        self._episode_index = by_id
+        self._episode_number_index = by_number
+
     def get_latest_episode(self) -> Optional[Episode]:
-        """Get the most recent episode."""
-        if not self.episodes:
-            return None
-        return max(self.episodes, key=lambda e: e.episode_number)
+        """
+        Get the most recent episode.
+
+        Episodes are kept in episode-number order (add_episode numbers
+        them sequentially), so this is the last one in the list.
+        """
+        return self.episodes[-1] if self.episodes else None
 
     def get_total_scenes(self) -> int:
         """Get total number of scenes across all episodes."""
@@ -270,10 +438,16 @@ class Series:
 
     def get_production_progress(self) -> float:
         """Get production progress as a percentage (0.0 - 1.0)."""
-        total = self.get_total_scenes()
+        # Single pass over all scenes for both totals
+        total = completed = 0
+        for episode in self.episodes:
+            total += len(episode.scenes)
+            for scene in episode.scenes:
+                if scene.status == SceneStatus.COMPLETED:
+                    completed += 1
         if total == 0:
             return 0.0
-        return self.get_completed_scenes() / total
+        return completed / total
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -282,57 +456,71 @@ class Series:
             "name": self.name,
             "description": self.description,
             "genre": self.genre,
-            "episodes": [e.to_dict() for e in self.episodes],
+            "episodes": list(map(Episode.to_dict, self.episodes)),
             "character_ids": self.character_ids,
             "status": self.status.value,
             "default_provider": self.default_provider,
             "default_model": self.default_model,
             "quality_preset": self.quality_preset,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
             "version": self.version,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON (uses orjson when installed)."""
+        data = self.to_dict()
+        if HAS_ORJSON:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Series":
+        """Create Series from JSON produced by to_json_bytes."""
+        if HAS_ORJSON:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
+
+    @classmethod
+    def from_config(cls, config: SeriesConfig) -> "Series":
+        """Create Series from a SeriesConfig."""
+        # Apply quality preset settings
+        quality_settings = config.quality_preset.get_settings()
+
+        series = cls(
+            name=config.name,
+            description=config.description,
+            genre=config.genre,
+            character_ids=list(config.characters),
+            default_provider=config.provider,
+            default_model=quality_settings.get("model", config.model),
+            default_duration=config.duration,
+            default_aspect_ratio=config.aspect_ratio,
+            quality_preset=config.quality_preset.value,
+            output_path=config.output_path,
+            episodes=config.episodes,
+        )
+
+        # Store full character data for export
+        series._characters = config.characters
+        series._locations = config.locations
+        series._style = config.style or StylePresets.cinematic()
+
+        return series
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Series":
         """Create Series from dictionary."""
-        series = cls(
-            series_id=data.get("series_id", str(uuid.uuid4())[:8]),
+        return cls(
+            series_id=data["series_id"] if "series_id" in data else _short_id(),
             name=data.get("name", ""),
             description=data.get("description", ""),
             genre=data.get("genre", ""),
             character_ids=data.get("character_ids", []),
             status=SeriesStatus(data.get("status", "draft")),
-            default_provider=data.get("default_provider", "fal"),
-            default_model=data.get("default_model", "kling-2.5"),
-            quality_preset=data.get("quality_preset", "balanced"),
+            default_provider=sys.intern(data.get("default_provider", _DEFAULT_PROVIDER)),
+            default_model=sys.intern(data.get("default_model", _DEFAULT_MODEL)),
+            quality_preset=sys.intern(data.get("quality_preset", _DEFAULT_QUALITY_PRESET)),
             version=data.get("version", "1.0.0"),
+            episodes=list(map(Episode.from_dict, data.get("episodes", ()))),
         )
-
-        # Parse episodes
-        for ep_data in data.get("episodes", []):
-            episode = Episode(
-                episode_id=ep_data.get("episode_id"),
-                episode_number=ep_data.get("episode_number", 1),
-                title=ep_data.get("title", ""),
-                description=ep_data.get("description", ""),
-                status=EpisodeStatus(ep_data.get("status", "planned")),
-            )
-
-            # Parse scenes
-            for scene_data in ep_data.get("scenes", []):
-                scene = Scene(
-                    scene_id=scene_data.get("scene_id"),
-                    scene_number=scene_data.get("scene_number", 1),
-                    action=scene_data.get("action", ""),
-                    character_ids=scene_data.get("character_ids", []),
-                    location_id=scene_data.get("location_id"),
-                    duration=scene_data.get("duration", 5),
-                    status=SceneStatus(scene_data.get("status", "pending")),
-                    video_path=scene_data.get("video_path"),
-                )
-                episode.scenes.append(scene)
-
-            series.episodes.append(episode)
-
-        return series
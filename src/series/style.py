@@ -8,7 +8,8 @@ Style definitions and quality presets for consistent visual output.
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -34,40 +35,44 @@ class QualityPreset(Enum):
 
     def get_settings(self) -> Dict[str, Any]:
         """Get the settings for this preset."""
-        presets = {
-            QualityPreset.DRAFT: {
-                "model": "veo-3-fast",
-                "duration": 5,
-                "resolution": "480p",
-                "with_audio": False,
-                "guidance_scale": 0.5,
-            },
-            QualityPreset.BALANCED: {
-                "model": "kling-2.5",
-                "duration": 5,
-                "resolution": "720p",
-                "with_audio": False,
-                "guidance_scale": 0.7,
-            },
-            QualityPreset.HIGH: {
-                "model": "kling-2.6",
-                "duration": 10,
-                "resolution": "1080p",
-                "with_audio": False,
-                "guidance_scale": 0.8,
-            },
-            QualityPreset.CINEMATIC: {
-                "model": "veo-3",
-                "duration": 8,
-                "resolution": "1080p",
-                "with_audio": True,
-                "guidance_scale": 0.9,
-            },
-        }
-        return presets.get(self, presets[QualityPreset.BALANCED])
-
-
-@dataclass
+        # Copy so callers can't mutate the shared table
+        return dict(_PRESET_SETTINGS.get(self, _PRESET_SETTINGS[QualityPreset.BALANCED]))
+
+
+# Settings per quality preset, built once at import
+_PRESET_SETTINGS: Dict[QualityPreset, Dict[str, Any]] = {
+    QualityPreset.DRAFT: {
+        "model": "veo-3-fast",
+        "duration": 5,
+        "resolution": "480p",
+        "with_audio": False,
+        "guidance_scale": 0.5,
+    },
+    QualityPreset.BALANCED: {
+        "model": "kling-2.5",
+        "duration": 5,
+        "resolution": "720p",
+        "with_audio": False,
+        "guidance_scale": 0.7,
+    },
+    QualityPreset.HIGH: {
+        "model": "kling-2.6",
+        "duration": 10,
+        "resolution": "1080p",
+        "with_audio": False,
+        "guidance_scale": 0.8,
+    },
+    QualityPreset.CINEMATIC: {
+        "model": "veo-3",
+        "duration": 8,
+        "resolution": "1080p",
+        "with_audio": True,
+        "guidance_scale": 0.9,
+    },
+}
+
+
+@dataclass(slots=True)
 class ColorPalette:
     """Color palette for consistent visual style."""
 
@@ -82,17 +87,23 @@ class ColorPalette:
 
     def to_prompt_fragment(self) -> str:
         """Build a prompt fragment describing the color palette."""
-        parts = []
-        if self.primary:
-            parts.append(f"primarily {self.primary}")
-        if self.warm_tones:
-            parts.append(f"warm tones ({', '.join(self.warm_tones)})")
-        if self.cool_tones:
-            parts.append(f"cool tones ({', '.join(self.cool_tones)})")
-        return ", ".join(parts) if parts else ""
+        return ", ".join(filter(None, (
+            f"primarily {self.primary}" if self.primary else "",
+            f"warm tones ({', '.join(self.warm_tones)})" if self.warm_tones else "",
+            f"cool tones ({', '.join(self.cool_tones)})" if self.cool_tones else "",
+        )))
 
 
-@dataclass
+# Fields each cached fragment/prompt is built from; caches compare these
+# on read instead of hooking every attribute write
+_lighting_key = attrgetter(
+    "type", "direction", "quality", "color_temperature", "time_of_day",
+    "rim_light", "volumetric",
+)
+_style_key = attrgetter("aesthetic", "mood", "era")
+
+
+@dataclass(slots=True)
 class LightingStyle:
     """Lighting configuration for visual consistency."""
 
@@ -107,34 +118,33 @@ class LightingStyle:
     ambient_occlusion: bool = False
     volumetric: bool = False
 
+    # Cached (lighting key, to_prompt_fragment result)
+    _fragment_cache: Optional[Tuple[tuple, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_prompt_fragment(self) -> str:
         """Build a prompt fragment describing the lighting."""
-        parts = []
-
-        if self.type:
-            parts.append(f"{self.type} lighting")
-
-        if self.time_of_day:
-            parts.append(self.time_of_day)
-        elif self.direction:
-            parts.append(f"{self.direction} light")
-
-        if self.quality:
-            parts.append(f"{self.quality} light quality")
-
-        if self.color_temperature:
-            parts.append(f"{self.color_temperature} color temperature")
-
-        if self.volumetric:
-            parts.append("volumetric lighting")
-
-        if self.rim_light:
-            parts.append("rim lighting")
-
-        return ", ".join(parts) if parts else ""
-
-
-@dataclass
+        cache = self._fragment_cache
+        key = _lighting_key(self)
+        if cache is None or cache[0] != key:
+            cache = (key, self._build_fragment())
+            self._fragment_cache = cache
+        return cache[1]
+
+    def _build_fragment(self) -> str:
+        """Assemble the lighting fragment."""
+        return ", ".join(filter(None, (
+            f"{self.type} lighting" if self.type else "",
+            self.time_of_day or (f"{self.direction} light" if self.direction else ""),
+            f"{self.quality} light quality" if self.quality else "",
+            f"{self.color_temperature} color temperature" if self.color_temperature else "",
+            "volumetric lighting" if self.volumetric else "",
+            "rim lighting" if self.rim_light else "",
+        )))
+
+
+@dataclass(slots=True)
 class CameraStyle:
     """Camera configuration for consistent framing."""
 
@@ -152,25 +162,34 @@ class CameraStyle:
 
     def to_prompt_fragment(self, override_shot: Optional[str] = None) -> str:
         """Build a prompt fragment describing the camera."""
-        parts = []
-
         shot = override_shot or self.default_shot
-        if shot:
-            parts.append(f"{shot} shot")
-
-        if self.default_angle and self.default_angle != "eye-level":
-            parts.append(f"{self.default_angle} angle")
-
-        if self.depth_of_field:
-            parts.append(f"{self.depth_of_field} depth of field")
-
-        if self.lens_style:
-            parts.append(f"{self.lens_style}")
-
-        return ", ".join(parts) if parts else ""
-
-
-@dataclass
+        angle = self.default_angle
+        return ", ".join(filter(None, (
+            f"{shot} shot" if shot else "",
+            f"{angle} angle" if angle and angle != "eye-level" else "",
+            f"{self.depth_of_field} depth of field" if self.depth_of_field else "",
+            self.lens_style,
+        )))
+
+
+# Default modifiers; each VisualStyle gets its own list copy
+_DEFAULT_STYLE_MODIFIERS: Tuple[str, ...] = (
+    "cinematic",
+    "professional lighting",
+    "high quality",
+)
+
+_DEFAULT_NEGATIVE_MODIFIERS: Tuple[str, ...] = (
+    "blurry",
+    "distorted",
+    "low quality",
+    "amateur",
+    "watermark",
+    "text",
+)
+
+
+@dataclass(slots=True)
 class VisualStyle:
     """
     Complete visual style definition for a series.
@@ -196,27 +215,51 @@ class VisualStyle:
     camera: CameraStyle = field(default_factory=CameraStyle)
 
     # Prompt modifiers (applied to all generations)
-    style_modifiers: List[str] = field(default_factory=lambda: [
-        "cinematic",
-        "professional lighting",
-        "high quality",
-    ])
+    style_modifiers: List[str] = field(
+        default_factory=lambda: list(_DEFAULT_STYLE_MODIFIERS)
+    )
 
     # Things to avoid
-    negative_modifiers: List[str] = field(default_factory=lambda: [
-        "blurry",
-        "distorted",
-        "low quality",
-        "amateur",
-        "watermark",
-        "text",
-    ])
+    negative_modifiers: List[str] = field(
+        default_factory=lambda: list(_DEFAULT_NEGATIVE_MODIFIERS)
+    )
 
     # Reference style images
     style_references: List[str] = field(default_factory=list)
 
+    # Cached (style key, style_modifiers snapshot, lighting fragment, style prompt)
+    _style_prompt_cache: Optional[Tuple[Tuple[str, ...], List[str], str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cached (negative_modifiers snapshot, negative prompt)
+    _negative_prompt_cache: Optional[Tuple[List[str], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def build_style_prompt(self) -> str:
         """Build the style portion of a prompt."""
+        # LightingStyle caches its fragment, so an unchanged lighting
+        # returns the same string object; modifier lists may be edited in place
+        lighting_fragment = self.lighting.to_prompt_fragment()
+        cache = self._style_prompt_cache
+        key = _style_key(self)
+        if (
+            cache is None
+            or cache[2] is not lighting_fragment
+            or cache[0] != key
+            or cache[1] != self.style_modifiers
+        ):
+            cache = (
+                key,
+                list(self.style_modifiers),
+                lighting_fragment,
+                self._build_style_prompt(lighting_fragment),
+            )
+            self._style_prompt_cache = cache
+        return cache[3]
+
+    def _build_style_prompt(self, lighting_fragment: str) -> str:
+        """Assemble the style prompt."""
         parts = []
 
         # Aesthetic
@@ -232,7 +275,6 @@ class VisualStyle:
             parts.append(self.era)
 
         # Lighting
-        lighting_fragment = self.lighting.to_prompt_fragment()
         if lighting_fragment:
             parts.append(lighting_fragment)
 
@@ -243,7 +285,14 @@ class VisualStyle:
 
     def get_negative_prompt(self) -> str:
         """Get the negative prompt."""
-        return ", ".join(self.negative_modifiers)
+        cache = self._negative_prompt_cache
+        if cache is None or cache[0] != self.negative_modifiers:
+            cache = (
+                list(self.negative_modifiers),
+                ", ".join(self.negative_modifiers),
+            )
+            self._negative_prompt_cache = cache
+        return cache[1]
 
     def build_complete_prompt(
         self,
@@ -7,11 +7,120 @@ Helper functions for image processing.
 
 import base64
 import logging
+import mmap
+import os
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
+# Optional: SIMD-accelerated base64 (falls back to stdlib)
+try:
+    import pybase64
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
 logger = logging.getLogger(__name__)
 
+# Image file extension -> MIME type
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+# Whitespace allowed between base64 characters (MIME-style line wrapping)
+_B64_WHITESPACE = b" \t\n\r\v\f"
+
+# Files smaller than this are read rather than memory-mapped for encoding
+_MMAP_THRESHOLD = 64 * 1024
+
+# JPEG quality (0-100) -> ffmpeg -q:v argument
+_QSCALE = tuple(str(int((100 - q) / 3) + 1) for q in range(101))
+
+
+def _qscale(quality: int) -> str:
+    """Convert a JPEG quality (1-100) to ffmpeg's -q:v scale."""
+    if 0 <= quality <= 100:
+        return _QSCALE[quality]
+    return str(int((100 - quality) / 3) + 1)
+
+
+@lru_cache(maxsize=None)
+def _import_pil():
+    """
+    Import Pillow's Image module on first use.
+
+    Pillow-SIMD installs under the same PIL name; its versions carry a
+    ".post" suffix, which is logged once so slow resizes can be traced
+    back to a plain Pillow install.
+    """
+    import PIL
+    from PIL import Image
+
+    if ".post" in PIL.__version__:
+        logger.debug("Using Pillow-SIMD %s", PIL.__version__)
+    else:
+        logger.debug("Using Pillow %s (Pillow-SIMD not installed)", PIL.__version__)
+    return Image
+
+
+def _b64encode(data) -> bytes:
+    """Base64-encode a bytes-like object with the fastest available codec."""
+    if HAS_PYBASE64:
+        return pybase64.b64encode(data)
+    return base64.b64encode(data)
+
+
+def decode_base64(data: Union[str, bytes]) -> bytes:
+    """
+    Decode strictly validated base64 (e.g. inline images or videos
+    returned by an API).
+
+    Whitespace such as MIME line breaks is stripped first; anything else
+    outside the base64 alphabet is rejected.
+
+    Args:
+        data: Base64 text
+
+    Returns:
+        Decoded bytes
+
+    Raises:
+        binascii.Error: If data contains non-alphabet characters or bad padding
+    """
+    if isinstance(data, str):
+        data = "".join(data.split())
+    else:
+        data = bytes(data).translate(None, _B64_WHITESPACE)
+    if HAS_PYBASE64:
+        return pybase64.b64decode(data, validate=True)
+    return base64.b64decode(data, validate=True)
+
+
+def _b64encode_file(path: Path) -> bytes:
+    """
+    Base64-encode a file's contents.
+
+    Large files are memory-mapped and encoded straight from the mapping,
+    so the raw bytes are never copied into a Python object. Small files
+    (thumbnails, icons) are read directly, where mmap/munmap setup would
+    cost more than the copy.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _b64encode(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _b64encode(mm)
+
+
+def _mime_type(path: Path) -> str:
+    """Determine an image's MIME type from its extension."""
+    return _MIME_TYPES.get(path.suffix.lower(), "image/jpeg")
+
 
 def encode_image(
     image_path: Union[str, Path],
@@ -29,23 +138,14 @@ def encode_image(
     """
     path = Path(image_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Image not found: {image_path}")
-
     # Determine MIME type
-    ext = path.suffix.lower()
-    mime_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-    }
-    mime_type = mime_types.get(ext, "image/jpeg")
+    mime_type = _mime_type(path)
 
     # Read and encode
-    with open(path, "rb") as f:
-        data = base64.b64encode(f.read()).decode("utf-8")
+    try:
+        data = _b64encode_file(path).decode("ascii")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image not found: {image_path}") from None
 
     return data, mime_type
 
@@ -60,8 +160,17 @@ def to_data_uri(image_path: Union[str, Path]) -> str:
     Returns:
         Data URI string (data:image/jpeg;base64,...)
     """
-    data, mime_type = encode_image(image_path)
-    return f"data:{mime_type};base64,{data}"
+    path = Path(image_path)
+
+    try:
+        encoded = _b64encode_file(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image not found: {image_path}") from None
+
+    # Base64 output is ASCII: join the prefix to the encoded bytes and
+    # decode once rather than building an intermediate payload string
+    prefix = f"data:{_mime_type(path)};base64,".encode("ascii")
+    return (prefix + encoded).decode("ascii")
 
 
 def resize_image(
@@ -83,35 +192,22 @@ def resize_image(
         Path to resized image
     """
     try:
-        from PIL import Image
+        Image = _import_pil()
 
         with Image.open(image_path) as img:
-            # Calculate new size
-            width, height = img.size
-            if width > height:
-                if width > max_size:
-                    new_width = max_size
-                    new_height = int(height * max_size / width)
-                else:
-                    new_width, new_height = width, height
-            else:
-                if height > max_size:
-                    new_height = max_size
-                    new_width = int(width * max_size / height)
-                else:
-                    new_width, new_height = width, height
-
-            # Resize
-            resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # Resize in place, never upscaling. thumbnail() computes the
+            # aspect-preserving size itself and, for JPEGs, asks the decoder
+            # for a reduced-resolution draft before the full pixels are read
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
             # Save
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             if output_path.suffix.lower() in (".jpg", ".jpeg"):
-                resized.save(output_path, "JPEG", quality=quality)
+                img.save(output_path, "JPEG", quality=quality)
             else:
-                resized.save(output_path)
+                img.save(output_path)
 
             return str(output_path)
 
@@ -140,8 +236,6 @@ def extract_frame(
     Returns:
         Path to extracted frame, or None if failed
     """
-    import subprocess
-
     video_path = Path(video_path)
     output_path = Path(output_path)
 
@@ -150,23 +244,14 @@ def extract_frame(
         return None
 
     try:
-        # Get video duration for "last" position
+        # Seek relative to the end for "last" so no ffprobe
+        # duration lookup (and second process) is needed
         if position == "last":
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(video_path),
-                ],
-                capture_output=True,
-                text=True,
-            )
-            duration = float(result.stdout.strip())
-            position = str(max(0, duration - 0.1))
-
+            seek = ["-sseof", "-0.1"]
         elif position == "first":
-            position = "0"
+            seek = ["-ss", "0"]
+        else:
+            seek = ["-ss", position]
 
         # Extract frame
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -174,10 +259,11 @@ def extract_frame(
         subprocess.run(
             [
                 "ffmpeg", "-y",
-                "-ss", position,
+                *seek,
                 "-i", str(video_path),
+                "-an", "-sn", "-dn",  # Video stream only
                 "-vframes", "1",
-                "-q:v", str(int((100 - quality) / 3) + 1),
+                "-q:v", _qscale(quality),
                 str(output_path),
             ],
             capture_output=True,
@@ -208,7 +294,7 @@ def get_image_dimensions(image_path: Union[str, Path]) -> Optional[Tuple[int, in
         Tuple of (width, height), or None if failed
     """
     try:
-        from PIL import Image
+        Image = _import_pil()
 
         with Image.open(image_path) as img:
             return img.size
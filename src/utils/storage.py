@@ -5,14 +5,48 @@ Storage Utilities
 Helper functions for file and metadata storage.
 """
 
+import io
 import json
 import logging
-from datetime import datetime
+import os
+import shutil
+import time
+import uuid
+from datetime import date, datetime, time as dt_time
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, BinaryIO, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Maximum bytes handed to a single os.write call when saving videos
+_WRITE_CHUNK_SIZE = 1 << 22
+
+# Units used by format_file_size, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Types orjson would serialize natively; routed through _json_default instead
+_ORJSON_PASSTHROUGH = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if HAS_ORJSON else 0
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON can't encode, identically with or without orjson."""
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
 
 def save_video(
     video_data: bytes,
@@ -31,13 +65,85 @@ def save_video(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "wb") as f:
-        f.write(video_data)
+    # Write straight to the file descriptor from a memoryview, so large
+    # clips are never sliced into copies or staged through an io buffer
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(video_data)
+        while view:
+            written = os.write(fd, view[:_WRITE_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+    logger.info(f"Video saved to {output_path}")
+    return str(output_path)
+
+
+def save_video_stream(
+    source: BinaryIO,
+    output_path: Union[str, Path],
+) -> str:
+    """
+    Save video data from an open binary file object.
+
+    When the source is a real file (e.g. a finished temp download), the
+    data is copied inside the kernel and never passes through Python.
+
+    Args:
+        source: Binary file object positioned at the start of the video
+        output_path: Path to save the video
+
+    Returns:
+        Path to saved video
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "wb") as dest:
+        if not _copy_file_range(source, dest):
+            shutil.copyfileobj(source, dest, _WRITE_CHUNK_SIZE)
 
     logger.info(f"Video saved to {output_path}")
     return str(output_path)
 
 
+def _copy_file_range(source: BinaryIO, dest: BinaryIO) -> bool:
+    """
+    Copy the rest of source into an empty dest with copy_file_range.
+
+    Returns False without copying anything when either side is not a
+    real file or the platform/filesystem does not support the call.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        source_fd = source.fileno()
+        dest_fd = dest.fileno()
+        # Buffered readers may have read ahead of their logical position,
+        # so pass the source offset explicitly
+        offset = source.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+
+    copied = 0
+    while True:
+        try:
+            count = os.copy_file_range(
+                source_fd, dest_fd, _WRITE_CHUNK_SIZE, offset + copied
+            )
+        except OSError:
+            if copied:
+                raise
+            return False
+        if not count:
+            break
+        copied += count
+
+    source.seek(offset + copied)
+    return True
+
+
 def save_metadata(
     metadata: Dict[str, Any],
     output_path: Union[str, Path],
@@ -64,9 +170,21 @@ def save_metadata(
         import yaml
         with open(output_path, "w") as f:
             yaml.dump(metadata, f, default_flow_style=False)
+    elif HAS_ORJSON:
+        output_path.write_bytes(
+            orjson.dumps(
+                metadata,
+                default=_json_default,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | _ORJSON_PASSTHROUGH
+                ),
+            )
+        )
     else:
         with open(output_path, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+            json.dump(metadata, f, indent=2, default=_json_default)
 
     logger.debug(f"Metadata saved to {output_path}")
     return str(output_path)
@@ -86,17 +204,18 @@ def load_metadata(
     """
     path = Path(path)
 
-    if not path.exists():
-        return None
-
     try:
         if path.suffix in (".yml", ".yaml"):
             import yaml
             with open(path, "r") as f:
                 return yaml.safe_load(f)
+        elif HAS_ORJSON:
+            return orjson.loads(path.read_bytes())
         else:
             with open(path, "r") as f:
                 return json.load(f)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Failed to load metadata from {path}: {e}")
         return None
@@ -117,6 +236,12 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     return path
 
 
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a UNIX second as local YYYYmmdd_HHMMSS (reused within a second)."""
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+
+
 def generate_filename(
     prefix: str = "video",
     suffix: str = ".mp4",
@@ -134,10 +259,11 @@ def generate_filename(
         Generated filename
     """
     if include_timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{prefix}_{timestamp}{suffix}"
+        # Nanosecond suffix keeps names unique within the same second
+        now = time.time_ns()
+        seconds, nanos = divmod(now, 1_000_000_000)
+        return f"{prefix}_{_format_timestamp(seconds)}_{nanos:09d}{suffix}"
     else:
-        import uuid
         return f"{prefix}_{uuid.uuid4().hex[:8]}{suffix}"
 
 
@@ -151,10 +277,10 @@ def get_file_size(path: Union[str, Path]) -> Optional[int]:
     Returns:
         File size in bytes, or None if file doesn't exist
     """
-    path = Path(path)
-    if path.exists():
-        return path.stat().st_size
-    return None
+    try:
+        return Path(path).stat().st_size
+    except FileNotFoundError:
+        return None
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -167,8 +293,6 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    exponent = min(max((int(size_bytes).bit_length() - 1) // 10, 0), 4)
+    return f"{size_bytes / (1 << (10 * exponent)):.1f} {_SIZE_UNITS[exponent]}"
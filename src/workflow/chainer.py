@@ -7,13 +7,50 @@ across multiple video clips in a series.
 """
 
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Sequence, Tuple, Union
 from dataclasses import dataclass
 
+from ..utils.image_utils import _qscale
+
 logger = logging.getLogger(__name__)
 
+# Pipe buffer size for ffmpeg/ffprobe output (avoids small-read stalls)
+_PIPE_BUFFER_SIZE = 1 << 20
+
+# ffprobe arguments printing a video's duration (video path appended)
+_FFPROBE_DURATION_ARGS = (
+    "ffprobe", "-v", "error",
+    "-show_entries", "format=duration",
+    "-of", "default=noprint_wrappers=1:nokey=1",
+)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(video_path: str, mtime_ns: int, size: int) -> float:
+    """
+    Run ffprobe for a video's duration (cached per file version).
+
+    Failures raise instead of returning None, so lru_cache never stores
+    them and a transient error is retried on the next call.
+    """
+    result = subprocess.run(
+        [*_FFPROBE_DURATION_ARGS, video_path],
+        capture_output=True,
+        text=True,
+        bufsize=_PIPE_BUFFER_SIZE,
+    )
+    return float(result.stdout.strip())
+
+
+def _escape_concat_path(path: Union[str, Path]) -> str:
+    """Absolute path quoted for a single-quoted concat demuxer entry."""
+    return str(Path(path).absolute()).replace("'", "'\\''")
+
 
 @dataclass
 class ChainContext:
@@ -81,28 +118,29 @@ class SceneChainer:
             return None
 
         try:
-            # Get video duration for "last" position
+            # Seek relative to the end for "last" so no ffprobe
+            # duration lookup (and second process) is needed
             if position == "last":
-                duration = self._get_video_duration(video_path)
-                if duration:
-                    position = str(max(0, duration - 0.1))
-                else:
-                    position = "99999"  # ffmpeg will use last frame
-
+                seek = ["-sseof", "-0.1"]
             elif position == "first":
-                position = "0"
+                seek = ["-ss", "0"]
+            else:
+                seek = ["-ss", position]
 
             # Build ffmpeg command
             cmd = [
                 "ffmpeg", "-y",
-                "-ss", position,
+                *seek,
                 "-i", str(video_path),
+                "-an", "-sn", "-dn",  # Video stream only
                 "-vframes", "1",
-                "-q:v", str(int((100 - quality) / 3) + 1),  # Convert to ffmpeg scale
+                "-q:v", _qscale(quality),
                 str(output_path),
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, bufsize=_PIPE_BUFFER_SIZE
+            )
 
             if output_path.exists():
                 logger.info(f"Extracted frame to {output_path}")
@@ -118,17 +156,9 @@ class SceneChainer:
     def _get_video_duration(self, video_path: Path) -> Optional[float]:
         """Get the duration of a video in seconds."""
         try:
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    str(video_path),
-                ],
-                capture_output=True,
-                text=True,
-            )
-            return float(result.stdout.strip())
+            stat = video_path.stat()
+            # Keyed by size and mtime so a rewritten video is probed again
+            return _probe_duration(str(video_path), stat.st_mtime_ns, stat.st_size)
         except Exception:
             return None
 
@@ -165,6 +195,33 @@ class SceneChainer:
             reference_images=reference_images or [],
         )
 
+    def create_chain_contexts(
+        self,
+        videos: Sequence[
+            Tuple[Union[str, Path], str, Optional[int], Optional[List[str]]]
+        ],
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[ChainContext]]:
+        """
+        Create chain contexts for several completed videos concurrently.
+
+        Each extraction is an ffmpeg subprocess, so threads overlap them
+        without contending for the GIL.
+
+        Args:
+            videos: (video_path, scene_id, seed, reference_images) per scene
+            max_workers: Thread count (defaults to the CPU count)
+
+        Returns:
+            ChainContext (or None if extraction failed) per input, in order
+        """
+        if not videos:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(videos))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda v: self.create_chain_context(*v), videos))
+
     def prepare_continuation_prompt(
         self,
         base_prompt: str,
@@ -237,23 +294,31 @@ class SceneChainer:
         output_path: Path,
     ) -> Optional[str]:
         """Simple concatenation without transitions."""
-        # Create file list
-        list_path = output_path.with_suffix(".txt")
-        with open(list_path, "w") as f:
-            for vp in video_paths:
-                f.write(f"file '{Path(vp).absolute()}'\n")
+        # Feed the file list to the concat demuxer over stdin rather than
+        # through a temporary list file. (The concat: protocol would avoid
+        # the list entirely but only works for byte-concatenable formats
+        # like MPEG-TS, not MP4.)
+        file_list = "".join(
+            f"file '{_escape_concat_path(vp)}'\n" for vp in video_paths
+        )
 
         cmd = [
             "ffmpeg", "-y",
             "-f", "concat",
             "-safe", "0",
-            "-i", str(list_path),
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
             "-c", "copy",
             str(output_path),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        list_path.unlink()  # Clean up
+        result = subprocess.run(
+            cmd,
+            input=file_list,
+            capture_output=True,
+            text=True,
+            bufsize=_PIPE_BUFFER_SIZE,
+        )
 
         if output_path.exists():
             logger.info(f"Concatenated {len(video_paths)} videos to {output_path}")
@@ -295,7 +360,9 @@ class SceneChainer:
             str(output_path),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, bufsize=_PIPE_BUFFER_SIZE
+        )
 
         if output_path.exists():
             return str(output_path)
@@ -331,12 +398,13 @@ class SceneChainer:
             "ffmpeg", "-y",
             "-ss", str(timestamp),
             "-i", str(video_path),
+            "-an", "-sn", "-dn",
             "-vframes", "1",
             "-vf", f"scale={size}",
             str(output_path),
         ]
 
-        subprocess.run(cmd, capture_output=True)
+        subprocess.run(cmd, capture_output=True, bufsize=_PIPE_BUFFER_SIZE)
 
         if output_path.exists():
             return str(output_path)
@@ -7,17 +7,59 @@ characters and style across a series.
 """
 
 import asyncio
+import copy
 import logging
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Set, Union
 import yaml
 
-from ..api import get_provider, get_best_provider
+# Optional: in-process video decoding (falls back to the ffmpeg CLI)
+try:
+    import av
+    HAS_PYAV = True
+except ImportError:
+    HAS_PYAV = False
+
+from ..api import get_provider, get_best_provider, list_providers
 from ..api.base import GenerationRequest, VideoGenerationResult, GenerationStatus
 from ..context import CharacterBible, SceneTracker, ReferenceManager
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _decode_last_frame(video_path: str, frame_path: Path) -> bool:
+    """
+    Decode a video's final frame with PyAV and save it as a JPEG.
+
+    Returns:
+        True if a frame was written
+    """
+    last_frame = None
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        # Seek back to the keyframe before the end, then decode forward
+        if stream.duration:
+            container.seek(max(0, stream.duration - 1), stream=stream)
+        for last_frame in container.decode(stream):
+            pass
+
+    if last_frame is None:
+        return False
+    last_frame.to_image().save(frame_path, quality=95)
+    return True
+
+
+@lru_cache(maxsize=32)
+def _read_config(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file (cached until the file's mtime changes)."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class VideoProducer:
     """
@@ -47,7 +89,8 @@ class VideoProducer:
             provider: Default provider name (or auto-select)
         """
         self.output_path = Path(output_path)
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs: Set[Path] = set()
+        self._ensure_dir(self.output_path)
 
         # Load configuration
         self.config = self._load_config(config_path)
@@ -65,15 +108,24 @@ class VideoProducer:
         self.default_provider_name = provider or self.config.get("default_provider", "fal")
         self._providers: Dict[str, Any] = {}
 
-        logger.info(f"VideoProducer initialized")
-        logger.info(f"  Output path: {self.output_path}")
-        logger.info(f"  Default provider: {self.default_provider_name}")
+        # Create the default provider up front so concurrent scene
+        # generation finds it ready
+        try:
+            self._get_provider()
+        except ValueError as e:
+            logger.warning("Default provider not available: %s", e)
+
+        logger.info("VideoProducer initialized")
+        logger.info("  Output path: %s", self.output_path)
+        logger.info("  Default provider: %s", self.default_provider_name)
 
     def _load_config(self, config_path: Optional[Union[str, Path]]) -> Dict:
         """Load configuration from file or use defaults."""
         if config_path and Path(config_path).exists():
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f)
+            path = Path(config_path).resolve()
+            config = _read_config(str(path), path.stat().st_mtime_ns)
+            # Deep copy so no instance can mutate the cached (shared) config
+            return copy.deepcopy(config)
 
         # Default configuration
         return {
@@ -85,14 +137,21 @@ class VideoProducer:
             "max_retries": 3,
         }
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once per producer (skips repeat mkdir calls)."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
     def _get_provider(self, provider_name: Optional[str] = None):
         """Get or create a provider instance."""
         name = provider_name or self.default_provider_name
 
-        if name not in self._providers:
-            self._providers[name] = get_provider(name)
-
-        return self._providers[name]
+        provider = self._providers.get(name)
+        if provider is None:
+            # setdefault keeps whichever instance was stored first
+            provider = self._providers.setdefault(name, get_provider(name))
+        return provider
 
     # -------------------------------------------------------------------------
     # High-Level Generation Methods
@@ -155,7 +214,7 @@ class VideoProducer:
         # Get chaining context
         first_frame = None
         if chain_from_previous and episode_id:
-            prev_context = self._get_chaining_context(episode_id)
+            prev_context = self._get_chaining_context(episode_id, scene_number)
             if prev_context:
                 first_frame = prev_context.get("last_frame_path")
                 # Modify prompt for continuation
@@ -204,7 +263,7 @@ class VideoProducer:
                     character_id, episode_id, scene_number
                 )
                 video_path = self.output_path / "videos" / video_filename
-                video_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(video_path.parent)
 
                 await provider_instance.download_video(result, video_path)
 
@@ -232,7 +291,7 @@ class VideoProducer:
             return result
 
         except Exception as e:
-            logger.error(f"Generation failed: {e}")
+            logger.error("Generation failed: %s", e)
             if scene:
                 self.scene_tracker.update_scene_status(
                     scene.scene_id, "failed", error_message=str(e)
@@ -258,6 +317,10 @@ class VideoProducer:
                 - action: What happens
                 - location_id: Optional location
                 - duration: Optional duration
+                - chain_from_previous: Continue from the previous scene's
+                  last frame (default True after the first scene); scenes
+                  that don't chain are generated concurrently, up to
+                  performance.max_concurrent_generations at a time
             title: Episode title
             **kwargs: Default parameters for all scenes
 
@@ -271,23 +334,46 @@ class VideoProducer:
             title=title,
         )
 
-        results = []
-
+        # Split scenes into chains: a scene that chains from the previous
+        # one (the default after the first) must wait for it, independent
+        # chains are generated concurrently
+        chains: List[List[int]] = []
         for i, scene_def in enumerate(scenes):
-            logger.info(f"Generating scene {i + 1}/{len(scenes)}")
-
-            result = await self.generate_scene(
-                episode_id=episode.episode_id,
-                scene_number=i + 1,
-                chain_from_previous=i > 0,  # Chain after first scene
-                **scene_def,
-                **kwargs,
-            )
-
-            results.append(result)
+            if chains and scene_def.get("chain_from_previous", i > 0):
+                chains[-1].append(i)
+            else:
+                chains.append([i])
+
+        results: List[Optional[VideoGenerationResult]] = [None] * len(scenes)
+        max_concurrent = self.config.get("performance", {}).get(
+            "max_concurrent_generations", 3
+        )
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run_chain(indices: List[int]) -> None:
+            for i in indices:
+                scene_def = dict(scenes[i])
+                chain = scene_def.pop("chain_from_previous", i > 0)
+                async with semaphore:
+                    logger.info("Generating scene %d/%d", i + 1, len(scenes))
+                    results[i] = await self.generate_scene(
+                        episode_id=episode.episode_id,
+                        scene_number=i + 1,
+                        chain_from_previous=chain,
+                        **scene_def,
+                        **kwargs,
+                    )
 
-            # Small delay between generations
-            await asyncio.sleep(1)
+        tasks = [asyncio.create_task(run_chain(chain)) for chain in chains]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One chain failed (or we were cancelled): stop the others so
+            # they don't keep making paid generation calls
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         return results
 
@@ -364,9 +450,22 @@ class VideoProducer:
     # Helper Methods
     # -------------------------------------------------------------------------
 
-    def _get_chaining_context(self, episode_id: str) -> Optional[Dict[str, Any]]:
+    def _get_chaining_context(
+        self,
+        episode_id: str,
+        scene_number: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Get context for chaining from previous scene."""
-        last_scene = self.scene_tracker.get_last_scene_in_episode(episode_id)
+        if scene_number:
+            # The scene right before this one; later scenes may already
+            # exist when independent chains are generated concurrently
+            previous = [
+                s for s in self.scene_tracker.get_scenes_for_episode(episode_id)
+                if s.scene_number < scene_number
+            ]
+            last_scene = previous[-1] if previous else None
+        else:
+            last_scene = self.scene_tracker.get_last_scene_in_episode(episode_id)
         if last_scene and last_scene.status == "completed":
             return {
                 "scene_id": last_scene.scene_id,
@@ -377,10 +476,7 @@ class VideoProducer:
 
     def _get_next_scene_number(self, episode_id: str) -> int:
         """Get the next scene number for an episode."""
-        scenes = self.scene_tracker.get_scenes_for_episode(episode_id)
-        if not scenes:
-            return 1
-        return max(s.scene_number for s in scenes) + 1
+        return (self.scene_tracker.get_max_scene_number(episode_id) or 0) + 1
 
     def _generate_filename(
         self,
@@ -389,8 +485,6 @@ class VideoProducer:
         scene_number: Optional[int],
     ) -> str:
         """Generate a filename for a video."""
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if episode_id and scene_number:
@@ -410,51 +504,37 @@ class VideoProducer:
             return None
 
         try:
-            # Use ffmpeg to extract last frame
-            import subprocess
-
             frame_path = Path(video_path).with_suffix(".last_frame.jpg")
 
-            # Get video duration first
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "default=noprint_wrappers=1:nokey=1",
-                    video_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
-
-            duration = float(result.stdout.strip())
-            last_frame_time = max(0, duration - 0.1)
-
-            # Extract frame
-            subprocess.run(
-                [
+            if HAS_PYAV:
+                # Decode in-process, off the event loop
+                await asyncio.to_thread(_decode_last_frame, video_path, frame_path)
+            else:
+                # Use ffmpeg to extract last frame, seeking from the end
+                proc = await asyncio.create_subprocess_exec(
                     "ffmpeg", "-y",
-                    "-ss", str(last_frame_time),
+                    "-sseof", "-0.1",
                     "-i", video_path,
                     "-vframes", "1",
                     "-q:v", "2",
                     str(frame_path),
-                ],
-                capture_output=True,
-            )
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await proc.wait()
 
             if frame_path.exists():
                 # Save to reference manager if we have scene_id
                 if scene_id:
-                    self.reference_manager.save_extracted_frame(
+                    self.reference_manager.save_extracted_frame_from_path(
                         scene_id,
-                        frame_path.read_bytes(),
+                        frame_path,
                         frame_type="last",
                     )
                 return str(frame_path)
 
         except Exception as e:
-            logger.warning(f"Could not extract last frame: {e}")
+            logger.warning("Could not extract last frame: %s", e)
 
         return None
 
@@ -472,7 +552,6 @@ class VideoProducer:
 
     def get_available_providers(self) -> List[str]:
         """Get list of available providers."""
-        from ..api import list_providers
         return list_providers()
 
     # -------------------------------------------------------------------------
@@ -6,15 +6,76 @@ Automated quality checks for generated videos.
 Validates character consistency, style adherence, and technical quality.
 """
 
+import asyncio
+import json
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
+
+# Optional: faster JSON parsing (falls back to stdlib json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# ffprobe video stream info keyed by (path, mtime_ns, size), so a file
+# is probed again once it changes; least recently used entries are evicted
+_PROBE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_PROBE_CACHE_SIZE = 4096
+
+# ffprobe arguments for the first video stream's info (video path appended)
+_FFPROBE_STREAM_ARGS = (
+    "ffprobe", "-v", "error",
+    "-select_streams", "v:0",
+    "-show_entries", "stream=width,height,duration,codec_name",
+    "-of", "json",
+)
+
 
-@dataclass
+async def _probe_video_stream(video_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Get ffprobe info for a video's first video stream.
+
+    Returns:
+        Stream info dict (cached per file version), or None if ffprobe failed
+    """
+    stat = video_path.stat()
+    key = (str(video_path), stat.st_mtime_ns, stat.st_size)
+    stream = _PROBE_CACHE.get(key)
+    if stream is not None:
+        _PROBE_CACHE.move_to_end(key)
+        return stream
+
+    # Run ffprobe without blocking the event loop
+    proc = await asyncio.create_subprocess_exec(
+        *_FFPROBE_STREAM_ARGS,
+        str(video_path),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate()
+
+    if proc.returncode != 0:
+        return None
+
+    if HAS_ORJSON:
+        info = orjson.loads(stdout)
+    else:
+        info = json.loads(stdout)
+    stream = info.get("streams", [{}])[0]
+
+    _PROBE_CACHE[key] = stream
+    if len(_PROBE_CACHE) > _PROBE_CACHE_SIZE:
+        _PROBE_CACHE.popitem(last=False)
+    return stream
+
+
+@dataclass(slots=True)
 class QualityReport:
     """Quality assessment report for a video."""
 
@@ -31,16 +92,11 @@ class QualityReport:
     auto_approved: bool = False
 
     # Issues found
-    issues: List[str] = None
-    warnings: List[str] = None
+    issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
 
     # Recommendations
-    recommendations: List[str] = None
-
-    def __post_init__(self):
-        self.issues = self.issues or []
-        self.warnings = self.warnings or []
-        self.recommendations = self.recommendations or []
+    recommendations: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -94,6 +150,7 @@ class QualityValidator:
         reference_images: Optional[List[str]] = None,
         expected_character: Optional[str] = None,
         expected_style: Optional[str] = None,
+        visual_scores: Optional[Dict[str, float]] = None,
     ) -> QualityReport:
         """
         Validate a generated video.
@@ -103,6 +160,7 @@ class QualityValidator:
             reference_images: Reference images for comparison
             expected_character: Expected character description
             expected_style: Expected style description
+            visual_scores: Precomputed AI visual scores (skips analysis)
 
         Returns:
             QualityReport with assessment results
@@ -119,13 +177,14 @@ class QualityValidator:
         report.technical_quality_score = tech_score
 
         # If AI provider is configured, do visual analysis
-        if self.ai_provider and reference_images:
+        if visual_scores is None and self.ai_provider and reference_images:
             visual_scores = await self._analyze_visual_quality(
                 video_path,
                 reference_images,
                 expected_character,
                 expected_style,
             )
+        if visual_scores is not None:
             report.character_consistency_score = visual_scores.get("character", 0.7)
             report.style_consistency_score = visual_scores.get("style", 0.7)
             report.motion_quality_score = visual_scores.get("motion", 0.7)
@@ -179,28 +238,12 @@ class QualityValidator:
         issues = []
 
         try:
-            import subprocess
-
             # Get video info using ffprobe
-            result = subprocess.run(
-                [
-                    "ffprobe", "-v", "error",
-                    "-select_streams", "v:0",
-                    "-show_entries", "stream=width,height,duration,codec_name",
-                    "-of", "json",
-                    str(video_path),
-                ],
-                capture_output=True,
-                text=True,
-            )
+            stream = await _probe_video_stream(video_path)
 
-            if result.returncode != 0:
+            if stream is None:
                 return 0.5  # File might be corrupted
 
-            import json
-            info = json.loads(result.stdout)
-            stream = info.get("streams", [{}])[0]
-
             width = stream.get("width", 0)
             height = stream.get("height", 0)
 
@@ -249,6 +292,34 @@ class QualityValidator:
             "motion": 0.75,
         }
 
+    async def _batch_analyze_visual_quality(
+        self,
+        video_paths: List[Path],
+        reference_images: List[str],
+        expected_character: Optional[str],
+        expected_style: Optional[str],
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Analyze visual quality of several videos in one AI call.
+
+        Placeholder like _analyze_visual_quality. In production, this would
+        extract frames for all videos concurrently, send a single vision
+        request covering every video (sharing one set of reference images)
+        and fan the returned per-scene scores out by video.
+
+        Returns:
+            Scores per video path (as str)
+        """
+        logger.info(
+            "Batch visual quality analysis would use AI here (%d videos)",
+            len(video_paths),
+        )
+
+        return {
+            str(path): {"character": 0.75, "style": 0.75, "motion": 0.75}
+            for path in video_paths
+        }
+
     def _add_recommendations(self, report: QualityReport) -> None:
         """Add recommendations based on scores."""
         if report.character_consistency_score < 0.7:
@@ -274,23 +345,52 @@ class QualityValidator:
     async def batch_validate(
         self,
         video_paths: List[Union[str, Path]],
+        max_concurrency: int = 8,
         **kwargs,
     ) -> List[QualityReport]:
         """
-        Validate multiple videos.
+        Validate multiple videos concurrently.
 
         Args:
             video_paths: List of video paths
-            **kwargs: Arguments passed to validate_video
+            max_concurrency: Maximum videos validated at once
+            **kwargs: Arguments passed to validate_video; visual_scores,
+                if given, applies to every video and skips the batch analysis
 
         Returns:
-            List of QualityReport objects
+            List of QualityReport objects, in input order. A video whose
+            validation raised gets a failed report listing the error.
         """
-        reports = []
-        for path in video_paths:
-            report = await self.validate_video(path, **kwargs)
-            reports.append(report)
-        return reports
+        # One AI call covers the visual analysis of the whole batch
+        shared_scores = kwargs.pop("visual_scores", None)
+        visual_scores: Dict[str, Dict[str, float]] = {}
+        if shared_scores is None and self.ai_provider and kwargs.get("reference_images"):
+            existing = [p for p in map(Path, video_paths) if p.exists()]
+            if existing:
+                visual_scores = await self._batch_analyze_visual_quality(
+                    existing,
+                    kwargs["reference_images"],
+                    kwargs.get("expected_character"),
+                    kwargs.get("expected_style"),
+                )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def validate_one(path: Union[str, Path]) -> QualityReport:
+            async with semaphore:
+                try:
+                    return await self.validate_video(
+                        path,
+                        visual_scores=visual_scores.get(str(Path(path)), shared_scores),
+                        **kwargs,
+                    )
+                except Exception as e:
+                    logger.error(f"Validation failed for {path}: {e}")
+                    report = QualityReport()
+                    report.issues.append(f"Validation error: {e}")
+                    return report
+
+        return list(await asyncio.gather(*(validate_one(p) for p in video_paths)))
 
     def get_summary(self, reports: List[QualityReport]) -> Dict[str, Any]:
         """
@@ -305,11 +405,16 @@ class QualityValidator:
         if not reports:
             return {}
 
-        passed_count = sum(1 for r in reports if r.passed)
-        auto_approved_count = sum(1 for r in reports if r.auto_approved)
-        review_needed_count = sum(1 for r in reports if r.requires_review)
+        # Single pass over the reports
+        passed_count = auto_approved_count = review_needed_count = 0
+        total_score = 0.0
+        for r in reports:
+            passed_count += r.passed
+            auto_approved_count += r.auto_approved
+            review_needed_count += r.requires_review
+            total_score += r.overall_score
 
-        avg_score = sum(r.overall_score for r in reports) / len(reports)
+        avg_score = total_score / len(reports)
 
         return {
             "total_videos": len(reports),